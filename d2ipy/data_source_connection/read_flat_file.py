@@ -6,6 +6,11 @@ and return the dataframe and meta files
 import os
 import pandas as pd
 
+try:
+    import polars as pl
+except ImportError:  # polars is an optional dependency
+    pl = None
+
 
 class ReadFlatFile:
     """
@@ -111,6 +116,13 @@ class ReadExcel(ReadFlatFile):
 class ReadCSV(ReadFlatFile):
     """ Reading CSV file and return the meta about file and the dataframe
 
+    With use_polars=True, polars installed and no pandas.read_csv keyword
+    arguments given, the file is parsed by the multi-threaded polars reader
+    and converted to pandas. That result doesn't always match
+    pandas.read_csv: blank lines become rows of missing values, numbers
+    padded with spaces stay strings and repeated header names are
+    suffixed "_duplicated_<n>" instead of ".<n>".
+
     Attributes:
         _df: pd.DataFrame
             After reading the csv file, the resultant dataframe
@@ -121,9 +133,37 @@ class ReadCSV(ReadFlatFile):
             return the shape of the dataframe
     """
 
-    def __init__(self, file_path: str, **kwargs: dict) -> None:
+    def __init__(
+        self, file_path: str, use_polars: bool = False, **kwargs: dict
+    ) -> None:
         super().__init__(file_path)
-        self._df = pd.read_csv(self.file_path, engine='c', **kwargs)
+        self._df = None
+        if use_polars and pl is not None and not kwargs:
+            self._df = self._read_with_polars()
+        if self._df is None:
+            self._df = pd.read_csv(self.file_path, engine='c', **kwargs)
+
+    def _read_with_polars(self) -> pd.DataFrame:
+        """
+        Parse the file with the multi-threaded polars reader. Returns None
+        when polars can't read it, so that pandas parses it instead.
+        """
+        try:
+            # The strings the installed pandas.read_csv parses as missing
+            # values. A private name: pandas parses the file if it moves.
+            from pandas._libs.parsers import STR_NA_VALUES
+
+            # Strict UTF-8, so that an invalid file raises like pandas does
+            # rather than getting its bytes replaced.
+            pl_df = pl.read_csv(
+                self.file_path,
+                null_values=sorted(STR_NA_VALUES),
+                infer_schema_length=10000,
+                encoding="utf8",
+            )
+            return pl_df.to_pandas()
+        except (pl.exceptions.PolarsError, ImportError):
+            return None
 
     def get_df(self) -> pd.DataFrame:
         """ Return the DataFrame """
@@ -30,6 +30,8 @@ class ModelD2I:
             The category column details
         _date_details: dict
             The date column details
+        _initialized: bool
+            Whether the statistics above have already been computed
 
     Methods:
     --------
@@ -45,7 +47,21 @@ class ModelD2I:
             returns the categorical column details
         get_date_details(): dict
             returns date column details
+        refresh(): None
+            recomputes every statistic after the dataframe was mutated
     """
+    __slots__ = (
+        "_df",
+        "_meta_data_obj",
+        "_desc_obj",
+        "meta_data",
+        "_col_meta",
+        "_desc_stat",
+        "_quantile_stat",
+        "_cat_details",
+        "_date_details",
+        "_initialized",
+    )
     _desc_obj: DescriptiveDetails
 
     def __init__(self, df):
@@ -69,15 +85,25 @@ class ModelD2I:
         self._quantile_stat = None
         self._cat_details = None
         self._date_details = None
+        self._initialized = False
 
         self.init_d2ipy()
 
     def init_d2ipy(self):
-        self._desc_obj.get_eligible_cols()
         self.set_descriptive_stat()
         self.set_quantile_stat()
         self.set_category_details()
         self.set_date_details()
+        self._initialized = True
+
+    def refresh(self):
+        """ Recompute all the statistics, e.g. after self._df was mutated """
+        self._meta_data_obj = descriptive_util.MetaData(self._df)
+        self._desc_obj = descriptive_util.DescriptiveDetails(self._df)
+        self.meta_data = None
+        self._col_meta = None
+        self._initialized = False
+        self.init_d2ipy()
 
     @property
     def get_pandas_df(self):
@@ -86,14 +112,16 @@ class ModelD2I:
 
     @property
     def get_metadata(self):
-        """ Return the metadata of the dataframe """
-        self.meta_data = self._meta_data_obj.get_meta()
+        """ Return the metadata of the dataframe, computed on first access """
+        if self.meta_data is None:
+            self.meta_data = self._meta_data_obj.get_meta()
         return self.meta_data
 
     @property
     def get_df_info(self):
-        """ Return the column level metadata """
-        self._col_meta = self._desc_obj.get_col_meta
+        """ Return the column level metadata, computed on first access """
+        if self._col_meta is None:
+            self._col_meta = self._desc_obj.get_col_meta()
         return self._col_meta
 
     def set_descriptive_stat(self):
@@ -111,8 +139,9 @@ class ModelD2I:
         self._date_details = self._desc_obj.get_date_details()
 
     def describe(self, column_type: str) -> dict:
-        """ Initialize all the descriptive values and set the attributes """
-        self.init_d2ipy()
+        """ Return the descriptive values, computing them only once """
+        if not self._initialized:
+            self.init_d2ipy()
         res = {}
         if column_type == 'all':
             res['quantile'] = self._quantile_stat
@@ -0,0 +1,62 @@
+"""
+Numba kernel computing the per-column moments of the numeric block in a
+single compiled pass. col_moments is None when numba is not installed.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is an optional dependency
+    njit = None
+
+if njit is not None:
+
+    @njit(parallel=True, cache=True)
+    def col_moments(arr):
+        """
+        Return a (4, n_cols) array holding the mean, sample variance,
+        skewness (as DataFrame.skew) and mean absolute deviation of every
+        column of the 2-D float64 array arr, ignoring NaN.
+        """
+        n_rows, n_cols = arr.shape
+        out = np.empty((4, n_cols))
+        for j in prange(n_cols):
+            count = 0
+            total = 0.0
+            for i in range(n_rows):
+                value = arr[i, j]
+                if not np.isnan(value):
+                    count += 1
+                    total += value
+            if count == 0:
+                out[:, j] = np.nan
+                continue
+            mean = total / count
+            m2 = 0.0
+            m3 = 0.0
+            abs_dev = 0.0
+            for i in range(n_rows):
+                value = arr[i, j]
+                if not np.isnan(value):
+                    dev = value - mean
+                    m2 += dev * dev
+                    m3 += dev * dev * dev
+                    abs_dev += abs(dev)
+            # Zero out floating point noise like pandas does.
+            if abs(m2) < 1e-14:
+                m2 = 0.0
+            if abs(m3) < 1e-14:
+                m3 = 0.0
+            out[0, j] = mean
+            out[1, j] = m2 / (count - 1) if count > 1 else np.nan
+            if count < 3:
+                out[2, j] = np.nan
+            elif m2 == 0.0:
+                out[2, j] = 0.0
+            else:
+                out[2, j] = (count * (count - 1) ** 0.5 / (count - 2)) * (m3 / m2 ** 1.5)
+            out[3, j] = abs_dev / count
+        return out
+
+else:
+    col_moments = None
@@ -1,13 +1,143 @@
 """
 This module is for explaining descriptive stats of a dataframe.
 """
-import sys
+import os
+import warnings
 from typing import Dict, Any, Union
 
+import numpy as np
 import pandas as pd
 from numpy import ndarray
 from pandas import Series
 
+from d2ipy.profiling._moments import col_moments
+
+try:
+    import bottleneck as bn
+except ImportError:  # bottleneck is an optional dependency
+    bn = None
+
+try:
+    import pyarrow  # noqa: F401  (enables the "string[pyarrow]" dtype)
+except ImportError:  # pyarrow is an optional dependency
+    pyarrow = None
+
+try:
+    from parallel_pandas import ParallelPandas
+except ImportError:  # parallel-pandas is an optional dependency
+    ParallelPandas = None
+
+# NaN aware column reductions: bottleneck's hand written loops when it is
+# installed, NumPy's otherwise. Both expose the same nan* functions.
+_nanfuncs = bn if bn is not None else np
+
+# Number of cells above which the numeric aggregations are split over the
+# CPU cores with parallel-pandas, when it is installed and numba is not (the
+# numba kernel already runs over the cores). Below it the pool overhead
+# outweighs the gain.
+PARALLEL_MIN_SIZE = 1_000_000
+_parallel_initialized = False
+
+# Percentiles reported by get_descriptive_stat, and the labels of their rows
+# in the numeric aggregate.
+PERCENTILES = [0.05, 0.25, 0.5, 0.75, 0.95]
+_PERCENTILE_LABELS = [f"{q:.0%}" for q in PERCENTILES]
+
+
+def _use_parallel(df: pd.DataFrame) -> bool:
+    """
+    Whether the aggregations over df should go through the parallel-pandas
+    p_* methods. Registers those methods on pandas on the first use.
+    """
+    global _parallel_initialized
+    if ParallelPandas is None or df.size <= PARALLEL_MIN_SIZE:
+        return False
+    # Forking the pool after the threaded numba kernel has run can hang the
+    # interpreter, and a single core gains nothing from the pool.
+    if col_moments is not None or (os.cpu_count() or 1) < 2:
+        return False
+    if not _parallel_initialized:
+        ParallelPandas.initialize(disable_pr_bar=True)
+        _parallel_initialized = True
+    return True
+
+
+def _mean_abs_dev(col: Series) -> float:
+    """ Mean absolute deviation of col around its mean, ignoring NaN """
+    return (col - col.mean()).abs().mean()
+
+
+def _dtype_positions(schema: pd.DataFrame, include, exclude=None) -> ndarray:
+    """
+    Return the positions of the columns of schema which
+    select_dtypes(include, exclude) keeps. Positions, unlike names, stay
+    unique when several columns share a name.
+    """
+    positional = schema.set_axis(range(schema.shape[1]), axis=1)
+    return positional.select_dtypes(include=include, exclude=exclude).columns.to_numpy()
+
+
+def _column_view(df: pd.DataFrame, positions: ndarray) -> pd.DataFrame:
+    """
+    Return the columns of df at the given positions without copying their
+    data, which df.iloc[:, positions] and df[names] do.
+    """
+    if len(positions) == 0:
+        # A slice, since taking an empty list consolidates df in place.
+        return df.iloc[:, :0]
+    if len(positions) == df.shape[1]:
+        return df
+    # Every column stays its own block, referencing the data of df.
+    # DataFrame.items is far cheaper per column than iloc.
+    columns = [col for _, col in df.items()]
+    view = pd.concat([columns[i] for i in positions], axis=1, copy=False)
+    view.columns = df.columns[positions]
+    return view
+
+
+def _count_values(values: ndarray, name: str) -> Series:
+    """
+    Count the occurrences of each value of an integer array and return
+    them the way Series.value_counts does, most frequent first.
+    """
+    uniques, counts = np.unique(values, return_counts=True)
+    return Series(counts, index=uniques, name=name).sort_values(ascending=False)
+
+
+def _nanskew(arr: ndarray) -> ndarray:
+    """
+    Column-wise bias corrected sample skewness of a 2-D array ignoring NaN,
+    computed the way DataFrame.skew does it.
+    """
+    count = np.sum(~np.isnan(arr), axis=0)
+    centered = arr - np.nanmean(arr, axis=0)
+    m2 = np.nansum(centered ** 2, axis=0)
+    m3 = np.nansum(centered ** 3, axis=0)
+    # Zero out floating point noise like pandas does, so that constant
+    # columns get a skewness of 0.
+    m2[np.abs(m2) < 1e-14] = 0
+    m3[np.abs(m3) < 1e-14] = 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        skew = count * np.sqrt(count - 1) / (count - 2) * m3 / m2 ** 1.5
+    skew[m2 == 0] = 0
+    skew[count < 3] = np.nan
+    return skew
+
+
+def _as_arrow_strings(col: Series) -> Series:
+    """
+    Convert an object column holding only strings to the Arrow-backed
+    "string[pyarrow]" dtype, whose value_counts and deep memory usage
+    run in Arrow's vectorized kernels. Other columns are returned as is.
+    """
+    if (
+        pyarrow is not None
+        and col.dtype == object
+        and pd.api.types.infer_dtype(col, skipna=True) == "string"
+    ):
+        return col.astype("string[pyarrow]")
+    return col
+
 
 class MetaData:
     """
@@ -52,12 +182,11 @@ class MetaData:
         Returns the dictionary which contains all the metadata
         => self.meta_dict
         """
-        self._n_records = self._df.shape[0]
-        self._n_columns = self._df.shape[1]
+        self._n_records, self._n_columns = self._df.shape
         self._fill_rate = (
-            (self._df.notna().sum().sum()) * 100 / (self._n_records * self._n_columns)
+            self._df.count().sum() * 100 / (self._n_records * self._n_columns)
         )
-        self._memory_size = sys.getsizeof(self._df)
+        self._memory_size = int(self._df.memory_usage(deep=True, index=True).sum())
         self.meta_dict = {
             "Num_Records": self._n_records,
             "Num_Columns": self._n_columns,
@@ -80,9 +209,21 @@ class DescriptiveDetails:
             The list of column which are of numeric datatype.
         self._num_col_df: pd.DataFrame
             The sliced dataframe which contains only numeric columns
+        self._obj_col_df: pd.DataFrame
+            The sliced dataframe which contains only categorical columns
+        self._dt_col_df: pd.DataFrame
+            The sliced dataframe which contains only date columns
+        self._num_agg: pd.DataFrame
+            mean, std, var, skew, mean absolute deviation (mad) and the
+            PERCENTILES ("5%", "25%", ...) of the numeric columns, one row
+            per statistic
+        self._num_totals: dict
+            min, max, range and sum of the numeric columns, each a Series
+            holding the values in the column dtype
         self._descriptive_dict: dict
             The dictionary which return descriptive details like min,
-            max, range, percentiles, IQR, and average
+            max, range, percentiles, IQR, and average, each as a Series
+            indexed by the numeric columns
         self._eligible_cols: dict
             The list of columns which don't have all nan or a constant
         self._quantile_dict: dict
@@ -95,6 +236,8 @@ class DescriptiveDetails:
         self._date_col_details: dict
             Contains some details around column of data type date like
             min, max, range, year wise and month wise distribution etc.
+        self._date_details_ls: list
+            The _date_col_details of every date column
 
     Methods:
         get_col_meta(): pd.DataFrame
@@ -102,15 +245,24 @@ class DescriptiveDetails:
         get_eligible_cols(): None
             Modify the dataframe to pick eligible columns by dropping the
             columns having all null values or constant.
+        get_numeric_array(): ndarray
+            Returns the numeric columns as one 2-D float64 array
+        get_numeric_agg(): pd.DataFrame
+            Returns the self._num_agg
+        get_numeric_totals(): dict
+            Returns the self._num_totals
         get_descriptive_stats(): dict
             Returns the self._descriptive_dict
         get_quantile_stat(): dict
             Returns the _quantile_dict
         get_category_details(): dict
             Returns the _obj_cols_dict
-        get_date_details(): dict
-            Returns the _date_col_details
+        get_date_details(): list
+            Returns the _date_details_ls
 
+    The getters compute their result on the first call and return the
+    stored result afterwards; the input dataframe is not expected to
+    change in between (see ModelD2I.refresh).
     """
 
     # TODO: Add Error class, if a dataframe has no record left after
@@ -121,14 +273,19 @@ class DescriptiveDetails:
         """Initializer of the class DescriptiveDetails"""
         self._obj_cols = None
         self._df_full = df
-        self._col_meta = pd.DataFrame()
+        self._col_meta = None
         self._num_col_df = None
+        self._obj_col_df = None
+        self._dt_col_df = None
+        self._num_agg = None
+        self._num_totals = None
         self._descriptive_dict = None
         self._quantile_dict = None
         self._num_cols = None
         self._eligible_cols = None
         self._obj_cols_dict = None
         self._date_col_details = None
+        self._date_details_ls = None
 
         self.init_process()
 
@@ -138,17 +295,26 @@ class DescriptiveDetails:
         self.get_col_type()
 
     def get_col_meta(self) -> pd.DataFrame:
-        """Return the self._col_meta"""
-        self._col_meta["columns"] = self._df_full.columns.tolist()
-        self._col_meta = self._col_meta.set_index('columns')
-        self._col_meta["present_datatype"] = self._df_full.dtypes.tolist()
-        self._col_meta["non_null_count"] = self._df_full.notna().sum()
-        self._col_meta["fill_rate"] = (self._df_full.notna().sum()) * 100 / len(self._df_full)
-        self._col_meta["num_unique"] = self._df_full.fillna(0).nunique()
-        self._col_meta["unique_rate"] = \
-            (self._df_full.fillna(0).nunique()) * 100 / len(self._df_full)
-
-        self._col_meta = self._col_meta.reset_index()
+        """Return the self._col_meta, building it on the first call"""
+        if self._col_meta is not None:
+            return self._col_meta
+        n_records = len(self._df_full)
+        non_null_count = self._df_full.notna().sum().to_numpy()
+        num_unique = self._df_full.nunique(dropna=False).to_numpy()
+        # Build every column first and the frame once, rather than inserting
+        # the columns one after the other.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self._col_meta = pd.DataFrame(
+                {
+                    "columns": self._df_full.columns,
+                    "present_datatype": self._df_full.dtypes.to_numpy(),
+                    "non_null_count": non_null_count,
+                    "fill_rate": non_null_count * 100 / n_records,
+                    "num_unique": num_unique,
+                    "unique_rate": num_unique * 100 / n_records,
+                    "is_eligible": (non_null_count != 0) | (num_unique != 1),
+                }
+            )
         return self._col_meta
 
     def get_eligible_cols(self) -> None:
@@ -157,77 +323,195 @@ class DescriptiveDetails:
         with eligible
         """
 
-        self._eligible_cols = self._col_meta.loc[
-            (self._col_meta["non_null_count"] != 0)
-            | (self._col_meta["num_unique"] != 1),
-            "columns",
-        ].tolist()
-        self._col_meta['is_eligible'] = False
-        self._col_meta.loc[self._col_meta['columns'].isin(self._eligible_cols), 'is_eligible'] = True
-        self._df = self._df_full[self._eligible_cols]
+        is_eligible = self._col_meta["is_eligible"].to_numpy()
+        self._eligible_cols = self._col_meta["columns"].to_numpy()[is_eligible].tolist()
+        self._df = _column_view(self._df_full, np.flatnonzero(is_eligible))
 
     def get_col_type(self):
-        self._num_cols = self._col_meta.loc[(self._col_meta['is_eligible'] == True) &
-                                            ((self._col_meta["present_datatype"] == int)
-                                             | (self._col_meta["present_datatype"] == float)),
-                                            "columns",
-        ].tolist()
+        # select_dtypes on the zero-row slice only looks at the dtypes,
+        # it doesn't copy the column data like it would on self._df.
+        schema = self._df.iloc[:0]
+        # "number" also matches timedelta and complex, whose values are not
+        # meaningful as float statistics.
+        num_pos = _dtype_positions(
+            schema, include="number", exclude=["timedelta", "complex"]
+        )
+        obj_pos = _dtype_positions(schema, include=["object", "string", "category"])
+        dt_pos = _dtype_positions(schema, include="datetime")
+        self._num_cols = schema.columns[num_pos].tolist()
+        self._obj_cols = schema.columns[obj_pos].tolist()
+        self._dt_cols = schema.columns[dt_pos].tolist()
+
+        self._obj_col_df = _column_view(self._df, obj_pos)
+        self._dt_col_df = _column_view(self._df, dt_pos)
+        if len(self._num_cols) >= 1:
+            self._num_col_df = _column_view(self._df, num_pos)
+        else:
+            self._num_col_df = pd.DataFrame()
 
-        self._obj_cols = self._col_meta.loc[
-            (self._col_meta["present_datatype"] == "object") & (self._col_meta["is_eligible"] == True), "columns"
-        ].tolist()
+    def get_numeric_array(self) -> ndarray:
+        """
+        Return the numeric columns copied into one 2-D float64 array, with
+        NaN for the missing values
+        """
+        # Filled column by column: DataFrame.to_numpy would consolidate the
+        # column views of self._num_col_df into a copy of their own first.
+        # Column major, so that every column is contiguous.
+        arr = np.empty(self._num_col_df.shape, dtype=np.float64, order="F")
+        for pos, (_, col) in enumerate(self._num_col_df.items()):
+            if isinstance(col.dtype, np.dtype):
+                # NaN already marks the missing values of NumPy dtypes.
+                arr[:, pos] = col.to_numpy()
+            else:
+                arr[:, pos] = col.to_numpy(dtype=np.float64, na_value=np.nan)
+        return arr
+
+    def get_numeric_agg(self) -> pd.DataFrame:
+        """
+        Return the self._num_agg, aggregating all the numeric columns
+        the first time
+        """
+        if self._num_agg is None:
+            if _use_parallel(self._num_col_df):
+                # The workers compute the MAD column by column too.
+                num_agg = self._num_col_df.p_agg(
+                    ["mean", "std", "var", "skew", _mean_abs_dev]
+                )
+                num_agg.index = ["mean", "std", "var", "skew", "mad"]
+                quantiles = self._num_col_df.p_quantile(PERCENTILES)
+                quantiles.index = _PERCENTILE_LABELS
+                num_agg = pd.concat([num_agg, quantiles])
+                # Nullable columns come back as object holding pd.NA; store
+                # float64 and NaN like the serial path does.
+                self._num_agg = num_agg.mask(num_agg.isna()).astype(np.float64)
+            else:
+                # The float64 copy of the columns is only alive for this call.
+                arr = self.get_numeric_array()
+                self._num_agg = self._aggregate_numeric_array(arr)
+                if self._num_totals is None:
+                    self._num_totals = self._numeric_totals(arr)
+        return self._num_agg
+
+    def _aggregate_numeric_array(self, arr: ndarray) -> pd.DataFrame:
+        """ Compute the rows of self._num_agg from the float64 array arr """
+        with warnings.catch_warnings():
+            # A column without values gives NaN, as in pandas.
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            if col_moments is not None:
+                # mean, variance, skewness and MAD in one compiled pass
+                mean, var, skew, mad = col_moments(arr)
+            else:
+                mean = _nanfuncs.nanmean(arr, axis=0)
+                var = _nanfuncs.nanvar(arr, axis=0, ddof=1)
+                skew = _nanskew(arr)
+                mad = np.nanmean(np.abs(arr - mean), axis=0)
+            stats = {
+                "mean": mean,
+                "std": np.sqrt(var),
+                "var": var,
+                "skew": skew,
+                "mad": mad,
+            }
+            # One call sorts each column once for all the percentiles.
+            quantiles = np.nanquantile(arr, PERCENTILES, axis=0)
+            stats.update(zip(_PERCENTILE_LABELS, quantiles))
+        return pd.DataFrame.from_dict(
+            stats, orient="index", columns=self._num_col_df.columns
+        )
 
-        self._dt_cols = self._col_meta.loc[
-            self._col_meta["present_datatype"] == "datetime64[ns]", "columns"
-        ].tolist()
+    def get_numeric_totals(self) -> dict:
+        """Return the self._num_totals"""
+        if self._num_totals is None:
+            self._num_totals = self._numeric_totals()
+        return self._num_totals
 
-        if len(self._num_cols) >= 1:
-            self._num_col_df = self._df_full[self._num_cols]
+    def _numeric_totals(self, arr: ndarray = None) -> dict:
+        """
+        Compute the min, max, range and sum of every numeric column. Float
+        columns are reduced on the float64 array arr when it is given, all
+        at once; the others on their own values, since pandas reduces the
+        single column blocks of self._num_col_df one at a time. Integer
+        minima and maxima are Python ints, so that the range can't overflow
+        the column dtype.
+        """
+        n_rows = len(self._num_col_df)
+        if arr is not None and n_rows > 0:
+            with warnings.catch_warnings():
+                # A column without values gives NaN, as in pandas.
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                arr_min = _nanfuncs.nanmin(arr, axis=0)
+                arr_max = _nanfuncs.nanmax(arr, axis=0)
+            # Summed like pandas does, so the results are identical; only
+            # the columns holding NaN need the copy np.nansum makes.
+            arr_sum = arr.sum(axis=0)
+            for pos in np.flatnonzero(np.isnan(arr_sum)):
+                arr_sum[pos] = np.nansum(arr[:, pos])
         else:
-            self._num_col_df = pd.DataFrame()
+            arr = None
+        totals = {"min": [], "max": [], "range": [], "sum": []}
+        for pos, (_, col) in enumerate(self._num_col_df.items()):
+            is_numpy = isinstance(col.dtype, np.dtype)
+            is_int = col.dtype.kind in "iu"
+            if arr is not None and is_numpy and col.dtype.kind == "f":
+                col_min, col_max, col_sum = arr_min[pos], arr_max[pos], arr_sum[pos]
+            elif is_int and is_numpy and n_rows > 0:
+                values = col.to_numpy()
+                col_min, col_max = int(values.min()), int(values.max())
+                col_sum = values.sum()
+            else:
+                col_min, col_max, col_sum = col.min(), col.max(), col.sum()
+                if is_int and not pd.isna(col_min):
+                    col_min, col_max = int(col_min), int(col_max)
+            totals["min"].append(col_min)
+            totals["max"].append(col_max)
+            totals["range"].append(col_max - col_min)
+            totals["sum"].append(col_sum)
+        return {
+            name: pd.Series(values, index=self._num_col_df.columns)
+            for name, values in totals.items()
+        }
 
     def get_descriptive_stat(self) -> dict:
         """Return the self._descriptive_dict"""
 
-        if len(self._num_col_df) > 0:
-            minimum = self._num_col_df.min(skipna=True)
-            maximum = self._num_col_df.max(skipna=True)
-            range_ = (maximum - minimum).to_dict()
-            minimum = minimum.to_dict()
-            maximum = maximum.to_dict()
-            percentile_05 = self._num_col_df.quantile(0.05).to_dict()
-            percentile_95 = self._num_col_df.quantile(0.95).to_dict()
-            percentile_25 = self._num_col_df.quantile(0.25)
-            median = self._num_col_df.quantile(0.5).to_dict()
-            mean_ = self._num_col_df.mean().to_dict()
-            percentile_75 = self._num_col_df.quantile(0.75)
-            iqr = (percentile_75 - percentile_25).to_dict()
-            percentile_25 = percentile_25.to_dict()
-            percentile_75 = percentile_75.to_dict()
+        if self._descriptive_dict is not None:
+            return self._descriptive_dict
+        if self._num_col_df.size > 0:
+            num_agg = self.get_numeric_agg()
+            # min and max on the native dtypes, so that integer columns keep
+            # exact integer values (the float64 array rounds beyond 2**53).
+            totals = self.get_numeric_totals()
+            percentile_25 = num_agg.loc["25%"]
+            percentile_75 = num_agg.loc["75%"]
+            # Keep the values as Series like get_quantile_stat does, and
+            # leave any dict conversion to the caller.
             self._descriptive_dict = {
-                "min": minimum,
-                "max": maximum,
-                "range": range_,
-                "5th_percentile": percentile_05,
-                "95th_percentile": percentile_95,
+                "min": totals["min"],
+                "max": totals["max"],
+                "range": totals["range"],
+                "5th_percentile": num_agg.loc["5%"],
+                "95th_percentile": num_agg.loc["95%"],
                 "25th_percentile": percentile_25,
                 "75th_percentile": percentile_75,
-                "IQR": iqr,
-                "median": median,
-                "mean": mean_,
+                "IQR": percentile_75 - percentile_25,
+                "median": num_agg.loc["50%"],
+                "mean": num_agg.loc["mean"],
             }
-            return self._descriptive_dict
         else:
-            return {}
+            self._descriptive_dict = {}
+        return self._descriptive_dict
 
     def get_quantile_stat(self) -> dict:
         """Returns the self._quantile_dict"""
-        if len(self._num_col_df) > 0:
-            std_dev = self._num_col_df.std(numeric_only=True, skipna=True)
-            mad = self._num_col_df.mad(skipna=True)
-            skewness = self._num_col_df.skew(numeric_only=True, skipna=True)
-            sum_ = self._num_col_df.sum(numeric_only=True, skipna=True)
-            variance_ = self._num_col_df.var(numeric_only=True, skipna=True)
+        if self._quantile_dict is not None:
+            return self._quantile_dict
+        if self._num_col_df.size > 0:
+            num_agg = self.get_numeric_agg()
+            std_dev = num_agg.loc["std"]
+            mad = num_agg.loc["mad"]
+            skewness = num_agg.loc["skew"]
+            sum_ = self.get_numeric_totals()["sum"]
+            variance_ = num_agg.loc["var"]
             #             monotonic = self._num_col_df.is_monotonic
             self._quantile_dict = {
                 "Standard Deviation": std_dev,
@@ -237,46 +521,61 @@ class DescriptiveDetails:
                 "variance": variance_
                 #                 "monotonicity": monotonic,
             }
-            return self._quantile_dict
         else:
-            return {}
+            self._quantile_dict = {}
+        return self._quantile_dict
 
     def get_category_details(self) -> dict:
         """Returns the self._obj_cols_dict"""
 
-        obj_df = self._df[self._obj_cols]
+        if self._obj_cols_dict is not None:
+            return self._obj_cols_dict
         self._obj_cols_dict = {}
-        for col_name in obj_df:
-            val_counts = obj_df[col_name].value_counts()
-            category_distribution = val_counts * 100 / len(obj_df)
-            top_5_category = obj_df[col_name].value_counts()[:5]
-            memory_size = sys.getsizeof(obj_df[col_name])
+        if len(self._obj_cols) == 0:
+            return self._obj_cols_dict
+        for col_name, col in self._obj_col_df.items():
+            col = _as_arrow_strings(col)
+            # value_counts is sorted by frequency, so the top 5 is a slice of it
+            val_counts = col.value_counts()
             self._obj_cols_dict[col_name] = {
-                "value_counts": memory_size,
-                "category_distribution": category_distribution,
-                "top_5_category": top_5_category,
-                "memory_size": memory_size,
+                "value_counts": val_counts,
+                "category_distribution": val_counts * 100 / len(col),
+                "top_5_category": val_counts.iloc[:5],
+                "memory_size": col.memory_usage(deep=True),
             }
         return self._obj_cols_dict
 
-    def get_date_details(self) -> dict:
-        """Return the self._date_col_details"""
+    def get_date_details(self) -> list:
+        """Return the self._date_details_ls"""
+        if self._date_details_ls is not None:
+            return self._date_details_ls
         res_ls = []
-        for col in self._dt_cols:
-            min_date = self._df[col].min()
-            max_date = self._df[col].max()
+        if len(self._dt_cols) >= 1:
+            min_max = self._dt_col_df.agg(["min", "max"])
+        for pos, (col, dates) in enumerate(self._dt_col_df.items()):
+            min_date = min_max.iat[0, pos]
+            max_date = min_max.iat[1, pos]
             range_date = max_date - min_date
-            yrs = self._df[col].dt.year.value_counts()
-            months = self._df[col].dt.month.value_counts()
-            days = self._df[col].dt.month.value_counts()
-            mon_yr = (
-                self._df[col].dt.month.astype(str)
-                + "-"
-                + self._df[col].dt.year.astype(str)
-            )
-            mon_yr_dist = mon_yr.value_counts()
-            date_dist = self._df[col].value_counts()
-            top_5_date = self._df[col].value_counts()[:5]
+            # Work on the raw datetime64 buffer: casting to year/month/day
+            # precision is plain integer arithmetic, unlike the .dt accessor.
+            values = dates.to_numpy()
+            values = values[~np.isnat(values)]
+            as_years = values.astype("datetime64[Y]")
+            as_months = values.astype("datetime64[M]")
+            yr_num = as_years.astype(np.int64) + 1970
+            mon_num = (as_months - as_years).astype(np.int64) + 1
+            day_num = (values.astype("datetime64[D]") - as_months).astype(np.int64) + 1
+            yrs = _count_values(yr_num, col)
+            months = _count_values(mon_num, col)
+            days = _count_values(day_num, col)
+            # Count on the month ordinal (months since 1970-01) and only
+            # format the distinct "month-year" labels, not one per row.
+            mon_yr_dist = _count_values(as_months.astype(np.int64), col)
+            mon_yr_dist.index = [
+                f"{mon_ord % 12 + 1}-{mon_ord // 12 + 1970}" for mon_ord in mon_yr_dist.index
+            ]
+            date_dist = dates.value_counts()
+            top_5_date = date_dist.iloc[:5]
             self._date_col_details = {
                 "column": col,
                 "min_date": min_date,
@@ -291,4 +590,5 @@ class DescriptiveDetails:
             }
 
             res_ls.append(self._date_col_details)
-        return res_ls
+        self._date_details_ls = res_ls
+        return self._date_details_ls
@@ -1,24 +1,76 @@
+import os
+from functools import lru_cache
+
 from d2ipy.data_source_connection import read_flat_file
 from d2ipy.model.d2i_model import ModelD2I
 
+# Number of files whose profiles are kept in memory by a Profiling
+# instance created with cache=True
+CACHE_SIZE = 16
+
+
+def _file_key(path):
+    """ Cache key identifying the current content of a file """
+    stat = os.stat(path)
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size
+
+
+def _profile_csv(csv_path, mtime_ns, size, use_polars=False):
+    """ Profile a CSV file. mtime_ns and size only key the cache """
+    csv_reader = read_flat_file.ReadCSV(csv_path, use_polars=use_polars)
+    _df = csv_reader.get_df()
+    return ModelD2I(_df)
+
+
+def _profile_excel(excel_path, mtime_ns, size):
+    """ Profile every sheet of an Excel file, keyed like _profile_csv """
+    excel_reader = read_flat_file.ReadExcel(excel_path)
+    sheet_names = excel_reader.get_sheet_names()
+    res_dict = {}
+    for sheet in sheet_names:
+        _df = excel_reader.read_sheet(sheet)
+        res_dict[sheet] = ModelD2I(_df)
+    return res_dict
+
 
 class Profiling:
-    def __init__(self):
-        pass
+    """
+    Entry point reading a flat file and profiling its content.
+
+    Every read returns new ModelD2I objects. With cache=True the instance
+    memoizes its last CACHE_SIZE profiles on the file path, modification
+    time and size instead, so reading an unchanged file again doesn't
+    parse or profile it a second time. The cached ModelD2I objects are
+    then shared by those reads: a change made to one of them, e.g. to its
+    dataframe, is seen by the next read of the same file.
 
-    def read_csv(self, csv_path):
-        csv_reader = read_flat_file.ReadCSV(csv_path)
-        df_shape = csv_reader.get_df_size()
-        _df = csv_reader.get_df()
-        dq_obj = ModelD2I(_df)
-        return dq_obj
+    With use_polars=True the CSV files are parsed by polars when it is
+    installed, see ReadCSV.
+    """
+
+    def __init__(self, cache: bool = False, use_polars: bool = False) -> None:
+        self._cache = cache
+        self._use_polars = use_polars
+        self._profile_csv = _profile_csv
+        self._profile_excel = _profile_excel
+        if cache:
+            self._profile_csv = lru_cache(maxsize=CACHE_SIZE)(_profile_csv)
+            self._profile_excel = lru_cache(maxsize=CACHE_SIZE)(_profile_excel)
+
+    def read_csv(self, csv_path, use_polars: bool = None):
+        """
+        Profile a CSV file. use_polars overrides the option the instance
+        was created with.
+        """
+        if use_polars is None:
+            use_polars = self._use_polars
+        return self._profile_csv(*_file_key(csv_path), use_polars)
 
     def read_excel(self, excel_path):
-        excel_reader = read_flat_file.ReadExcel(excel_path)
-        excel_file_obj = excel_reader.read_excel_file()
-        sheet_names = excel_reader.get_sheet_names()
-        res_dict = {}
-        for sheet in sheet_names:
-            _df = excel_reader.read_sheet(sheet)
-            res_dict[sheet] = ModelD2I(_df)
-        return res_dict
+        return dict(self._profile_excel(*_file_key(excel_path)))
+
+    def clear_cache(self) -> None:
+        """ Drop the profiles memoized by this instance """
+        if self._cache:
+            self._profile_csv.cache_clear()
+            self._profile_excel.cache_clear()
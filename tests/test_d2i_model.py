@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+
+"""Tests for `d2ipy.model.d2i_model`."""
+
+
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from d2ipy.model.d2i_model import ModelD2I
+
+
+class TestModelD2I(unittest.TestCase):
+    """ ModelD2I accessors """
+
+    def setUp(self):
+        self.df = pd.DataFrame({"a": [1, 2, None], "s": ["x", "y", "x"]})
+        self.model = ModelD2I(self.df)
+
+    def test_get_df_info(self):
+        # The column metadata built by the constructor is reused, not
+        # recomputed from the frame.
+        with mock.patch.object(
+            pd.DataFrame, "nunique", side_effect=AssertionError("rescan")
+        ):
+            col_meta = self.model.get_df_info
+        self.assertIsInstance(col_meta, pd.DataFrame)
+        self.assertEqual(col_meta["columns"].tolist(), ["a", "s"])
+        self.assertEqual(col_meta["non_null_count"].tolist(), [2, 3])
+        self.assertIs(self.model.get_df_info, col_meta)
+
+    def test_refresh(self):
+        self.model.get_pandas_df.loc[0, "a"] = 10
+        self.model.refresh()
+        descriptive = self.model.describe("numeric")["descriptive"]
+        self.assertEqual(descriptive["max"]["a"], 10)
+
+    def test_get_metadata(self):
+        meta = self.model.get_metadata
+        self.assertEqual(meta["Num_Records"], 3)
+        self.assertEqual(meta["Num_Columns"], 2)
+        self.assertEqual(
+            meta["Memory Size"],
+            self.df.memory_usage(deep=True, index=True).sum(),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
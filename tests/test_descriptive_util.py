@@ -0,0 +1,338 @@
+#!/usr/bin/env python
+
+"""Tests for `d2ipy.profiling.descriptive_util`."""
+
+
+import subprocess
+import sys
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from d2ipy.profiling import descriptive_util
+from d2ipy.profiling.descriptive_util import DescriptiveDetails
+
+MOMENTS = ["mean", "std", "var", "skew"]
+
+
+def _numeric_frame(n_rows):
+    """ A frame covering the column shapes the numeric aggregate handles """
+    rng = np.random.default_rng(0)
+    with_nan = rng.normal(size=n_rows)
+    with_nan[1::3] = np.nan
+    nullable = pd.array(rng.integers(0, 100, n_rows), dtype="Int64")
+    nullable[1::3] = pd.NA
+    return pd.DataFrame(
+        {
+            "normal": rng.normal(10, 3, n_rows),
+            "with_nan": with_nan,
+            "constant": np.full(n_rows, 7.0),
+            "nullable": nullable,
+            "large_int": 2 ** 40 + rng.integers(0, 1000, n_rows),
+            "small_int": rng.integers(0, 5, n_rows),
+            # Integer valued floats, which float32 represents exactly
+            "float32_exact": rng.integers(2 ** 23, 2 ** 24, n_rows).astype(
+                float
+            ),
+        }
+    )
+
+
+class TestNumericAggregate(unittest.TestCase):
+    """ get_numeric_agg and the stat getters against pandas """
+
+    def assert_matches_pandas(self, df):
+        desc = DescriptiveDetails(df)
+        num_agg = desc.get_numeric_agg()
+        ref = df.astype("float64")
+        expected = ref.agg(MOMENTS)
+        expected.loc["mad"] = (ref - ref.mean()).abs().mean()
+        quantiles = ref.quantile(descriptive_util.PERCENTILES)
+        quantiles.index = ["5%", "25%", "50%", "75%", "95%"]
+        expected = pd.concat([expected, quantiles])
+        for stat in expected.index:
+            np.testing.assert_allclose(
+                num_agg.loc[stat].to_numpy(dtype=float),
+                expected.loc[stat].to_numpy(dtype=float),
+                rtol=1e-7,
+                atol=1e-9,
+                err_msg=f"{stat} of {len(df)} rows",
+            )
+        descriptive = desc.get_descriptive_stat()
+        quantile = desc.get_quantile_stat()
+        for name, expected_values in [
+            ("min", df.min()),
+            ("max", df.max()),
+            ("range", df.max() - df.min()),
+        ]:
+            self.assertEqual(
+                descriptive[name].to_dict(), expected_values.to_dict()
+            )
+        self.assertEqual(quantile["sum"].to_dict(), df.sum().to_dict())
+
+    def test_serial(self):
+        for n_rows in (1, 2, 200):
+            self.assert_matches_pandas(_numeric_frame(n_rows))
+
+    def test_without_numba(self):
+        with mock.patch.object(descriptive_util, "col_moments", None):
+            for n_rows in (1, 2, 200):
+                self.assert_matches_pandas(_numeric_frame(n_rows))
+
+    def test_parallel(self):
+        if descriptive_util.ParallelPandas is None:
+            self.skipTest("parallel-pandas is not installed")
+        if descriptive_util.col_moments is not None:
+            # The parallel path only runs without numba: forking the pool
+            # once the numba kernel ran in this process can hang at exit.
+            self.skipTest("numba is installed, see test_parallel_subprocess")
+        with mock.patch.object(
+            descriptive_util, "PARALLEL_MIN_SIZE", 0
+        ), mock.patch.object(
+            descriptive_util.os, "cpu_count", return_value=4
+        ):
+            self.assertTrue(descriptive_util._use_parallel(_numeric_frame(2)))
+            for n_rows in (2, 200):
+                self.assert_matches_pandas(_numeric_frame(n_rows))
+
+    def test_parallel_subprocess(self):
+        if descriptive_util.ParallelPandas is None:
+            self.skipTest("parallel-pandas is not installed")
+        # Run test_parallel in an interpreter where numba can't be imported.
+        code = (
+            "import sys, unittest; sys.modules['numba'] = None; "
+            "unittest.main(module=None, argv=['', '{}'])".format(
+                f"{__name__}.TestNumericAggregate.test_parallel"
+            )
+        )
+        result = subprocess.run(
+            [sys.executable, "-W", "ignore", "-c", code],
+            capture_output=True,
+            text=True,
+            timeout=300,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertNotIn("skipped", result.stderr)
+
+    def test_parallel_needs_several_cores(self):
+        with mock.patch.object(
+            descriptive_util, "PARALLEL_MIN_SIZE", 0
+        ), mock.patch.object(
+            descriptive_util, "col_moments", None
+        ), mock.patch.object(
+            descriptive_util.os, "cpu_count", return_value=1
+        ):
+            self.assertFalse(descriptive_util._use_parallel(_numeric_frame(2)))
+
+    def test_no_parallel_with_numba(self):
+        if descriptive_util.col_moments is None:
+            self.skipTest("numba is not installed")
+        with mock.patch.object(
+            descriptive_util, "PARALLEL_MIN_SIZE", 0
+        ), mock.patch.object(
+            descriptive_util.os, "cpu_count", return_value=4
+        ):
+            self.assertFalse(descriptive_util._use_parallel(_numeric_frame(2)))
+
+    def test_large_int_is_exact(self):
+        ids = np.array([2 ** 60 + 1, 2 ** 60 + 3, 2 ** 60 + 7])
+        desc = DescriptiveDetails(pd.DataFrame({"id": ids}))
+        descriptive = desc.get_descriptive_stat()
+        self.assertEqual(descriptive["min"]["id"], 2 ** 60 + 1)
+        self.assertEqual(descriptive["max"]["id"], 2 ** 60 + 7)
+        self.assertEqual(descriptive["range"]["id"], 6)
+        self.assertEqual(
+            desc.get_quantile_stat()["sum"]["id"], 3 * 2 ** 60 + 11
+        )
+        self.assertEqual(descriptive["min"].dtype.kind, "i")
+
+    def test_range_does_not_overflow(self):
+        # One column per frame: the min and max of a mixed frame are upcast.
+        for values, expected in [
+            ([-100, 0, 100, 5], 200),
+            ([30000, 32000, -32000], 64000),
+            (pd.array([-100, 0, 100, None], dtype="Int64"), 200),
+        ]:
+            desc = DescriptiveDetails(pd.DataFrame({"x": values}))
+            self.assertEqual(
+                desc.get_descriptive_stat()["range"]["x"], expected
+            )
+
+    def test_range_of_small_int_dtypes(self):
+        for values, expected in [
+            (np.array([-100, 0, 100, 5], dtype=np.int8), 200),
+            (np.array([30000, 32000, -32000], dtype=np.int16), 64000),
+            (np.array([0, 255], dtype=np.uint8), 255),
+            (pd.array([-100, 100, None], dtype="Int8"), 200),
+            (np.array([-(2 ** 63), 2 ** 63 - 1]), 2 ** 64 - 1),
+        ]:
+            desc = DescriptiveDetails(pd.DataFrame({"x": values}))
+            descriptive = desc.get_descriptive_stat()
+            self.assertEqual(descriptive["range"]["x"], expected)
+            self.assertEqual(descriptive["min"]["x"], pd.Series(values).min())
+            self.assertEqual(descriptive["max"]["x"], pd.Series(values).max())
+
+    def test_float_columns_keep_float64(self):
+        values = np.arange(2 ** 23, 2 ** 23 + 1000, dtype=float)
+        desc = DescriptiveDetails(pd.DataFrame({"x": values}))
+        self.assertEqual(desc._num_col_df["x"].dtype, np.float64)
+        self.assertEqual(desc.get_quantile_stat()["sum"]["x"], values.sum())
+        self.assertEqual(
+            desc.get_descriptive_stat()["mean"]["x"], values.mean()
+        )
+
+
+class TestDateDetails(unittest.TestCase):
+    """ get_date_details """
+
+    def setUp(self):
+        dates = pd.Series(
+            pd.to_datetime(
+                ["2020-01-05", "2020-01-05", "2021-03-17", None, "2019-12-31"]
+            )
+        )
+        self.dates = dates
+        desc = DescriptiveDetails(pd.DataFrame({"d": dates}))
+        self.details = desc.get_date_details()[0]
+
+    def test_date_parts(self):
+        for key, expected in [
+            ("years", self.dates.dt.year),
+            ("months", self.dates.dt.month),
+            ("days", self.dates.dt.day),
+        ]:
+            self.assertEqual(
+                self.details[key].to_dict(),
+                expected.dropna().astype(int).value_counts().to_dict(),
+                key,
+            )
+
+    def test_month_year_distribution(self):
+        self.assertEqual(
+            self.details["month_yr_dist"].to_dict(),
+            {"1-2020": 2, "3-2021": 1, "12-2019": 1},
+        )
+
+    def test_min_max(self):
+        self.assertEqual(self.details["min_date"], pd.Timestamp("2019-12-31"))
+        self.assertEqual(self.details["max_date"], pd.Timestamp("2021-03-17"))
+
+
+
+class TestColumnTypes(unittest.TestCase):
+    """ get_col_type """
+
+    def test_timedelta_and_complex_are_not_numeric(self):
+        df = pd.DataFrame(
+            {
+                "n": [1.5, 2.0, 3.0],
+                "td": pd.to_timedelta([1, 2, 3], unit="D"),
+                "c": np.array([1 + 1j, 2, 3j]),
+                "s": ["x", "y", "x"],
+                "d": pd.to_datetime(["2020-01-01", "2020-01-02", None]),
+            }
+        )
+        desc = DescriptiveDetails(df)
+        self.assertEqual(desc._num_cols, ["n"])
+        self.assertEqual(desc._obj_cols, ["s"])
+        self.assertEqual(desc._dt_cols, ["d"])
+        self.assertEqual(list(desc.get_descriptive_stat()["min"].index), ["n"])
+
+    def test_duplicate_column_names(self):
+        df = pd.DataFrame(
+            [[1, 2.5, "x"], [3, 4.5, "y"]], columns=["a", "a", "s"]
+        )
+        desc = DescriptiveDetails(df)
+        self.assertEqual(desc._num_col_df.shape[1], 2)
+        descriptive = desc.get_descriptive_stat()
+        self.assertEqual(descriptive["min"].tolist(), [1, 2.5])
+        self.assertEqual(descriptive["range"].tolist(), [2, 2.0])
+        self.assertEqual(desc.get_quantile_stat()["sum"].tolist(), [4, 7.0])
+
+    def test_slices_share_the_input_data(self):
+        df = pd.DataFrame(
+            {"a": np.arange(10.0), "b": np.arange(10.0) * 2, "s": "x"}
+        )
+        values = df["a"].to_numpy()
+        desc = DescriptiveDetails(df)
+        desc.get_descriptive_stat()
+        for sliced in (desc._df, desc._num_col_df):
+            self.assertTrue(np.shares_memory(sliced["a"].to_numpy(), values))
+
+
+
+class TestCategoryDetails(unittest.TestCase):
+    """ get_category_details """
+
+    def setUp(self):
+        self.df = pd.DataFrame(
+            {
+                "s": list("aababcdefg"),
+                "c": pd.Categorical(list("xxyyyzzzzz")),
+                "n": range(10),
+            }
+        )
+        self.details = DescriptiveDetails(self.df).get_category_details()
+
+    def test_value_counts(self):
+        self.assertEqual(list(self.details), ["s", "c"])
+        s_details = self.details["s"]
+        self.assertEqual(
+            s_details["value_counts"].to_dict(),
+            self.df["s"].value_counts().to_dict(),
+        )
+        self.assertEqual(
+            s_details["category_distribution"].to_dict(),
+            (self.df["s"].value_counts() * 10).to_dict(),
+        )
+        self.assertEqual(
+            s_details["top_5_category"].tolist(), [3, 2, 1, 1, 1]
+        )
+
+    def test_memory_size(self):
+        self.assertEqual(
+            self.details["c"]["memory_size"],
+            self.df["c"].memory_usage(deep=True),
+        )
+
+    def test_without_object_columns(self):
+        desc = DescriptiveDetails(pd.DataFrame({"n": [1, 2, 3]}))
+        self.assertEqual(desc.get_category_details(), {})
+
+
+
+class TestCaching(unittest.TestCase):
+    """ The getters compute their result once """
+
+    def test_getters_return_the_stored_result(self):
+        df = pd.DataFrame(
+            {
+                "n": [1.0, 2.0, 4.0],
+                "s": ["x", "y", "x"],
+                "d": pd.to_datetime(["2020-01-01", "2020-02-01", None]),
+            }
+        )
+        desc = DescriptiveDetails(df)
+        getters = [
+            desc.get_col_meta,
+            desc.get_numeric_agg,
+            desc.get_numeric_totals,
+            desc.get_descriptive_stat,
+            desc.get_quantile_stat,
+            desc.get_category_details,
+            desc.get_date_details,
+        ]
+        first = [getter() for getter in getters]
+        with mock.patch.object(
+            desc, "get_numeric_array", side_effect=AssertionError("rescan")
+        ), mock.patch.object(
+            pd.Series, "value_counts", side_effect=AssertionError("rescan")
+        ):
+            for getter, result in zip(getters, first):
+                self.assertIs(getter(), result, getter.__name__)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+
+"""Tests for `d2ipy.profiling.profiling`."""
+
+
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from d2ipy.profiling.profiling import Profiling
+
+
+class TestProfilingCache(unittest.TestCase):
+    """ Profiling(cache=True) """
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.csv_path = os.path.join(tmp_dir.name, "data.csv")
+        self.write_csv([1, 2, 3])
+
+    def write_csv(self, values):
+        pd.DataFrame({"a": values, "s": ["x"] * len(values)}).to_csv(
+            self.csv_path, index=False
+        )
+
+    def test_hit(self):
+        profiling = Profiling(cache=True)
+        model = profiling.read_csv(self.csv_path)
+        self.assertIs(profiling.read_csv(self.csv_path), model)
+
+    def test_rewritten_file_is_read_again(self):
+        profiling = Profiling(cache=True)
+        model = profiling.read_csv(self.csv_path)
+        self.write_csv([1, 2, 3, 40])
+        reread = profiling.read_csv(self.csv_path)
+        self.assertIsNot(reread, model)
+        self.assertEqual(reread.get_pandas_df["a"].tolist(), [1, 2, 3, 40])
+
+    def test_clear_cache(self):
+        profiling = Profiling(cache=True)
+        model = profiling.read_csv(self.csv_path)
+        profiling.clear_cache()
+        self.assertIsNot(profiling.read_csv(self.csv_path), model)
+
+    def test_instances_do_not_share(self):
+        model = Profiling(cache=True).read_csv(self.csv_path)
+        self.assertIsNot(Profiling(cache=True).read_csv(self.csv_path), model)
+
+    def test_without_cache(self):
+        profiling = Profiling()
+        model = profiling.read_csv(self.csv_path)
+        self.assertIsNot(profiling.read_csv(self.csv_path), model)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+
+"""Tests for `d2ipy.data_source_connection.read_flat_file`."""
+
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from pandas.testing import assert_frame_equal
+
+from d2ipy.data_source_connection import read_flat_file
+from d2ipy.data_source_connection.read_flat_file import ReadCSV
+from d2ipy.profiling.profiling import Profiling
+
+
+class TestReadCSVPolars(unittest.TestCase):
+    """ ReadCSV(use_polars=True) """
+
+    def setUp(self):
+        if read_flat_file.pl is None:
+            self.skipTest("polars is not installed")
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.csv_path = os.path.join(tmp_dir.name, "data.csv")
+        with open(self.csv_path, "w") as csv_file:
+            csv_file.write(
+                "id,price,name,flag\n"
+                "1,2.5,apple,x\n"
+                "2,,NA,y\n"
+                "3,4.25,pear,\n"
+                "4,1e3,n/a,z\n"
+            )
+        patcher = mock.patch.object(
+            ReadCSV,
+            "_read_with_polars",
+            autospec=True,
+            side_effect=ReadCSV._read_with_polars,
+        )
+        self.read_with_polars = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_matches_pandas(self):
+        expected = ReadCSV(self.csv_path).get_df()
+        self.read_with_polars.assert_not_called()
+        result = ReadCSV(self.csv_path, use_polars=True).get_df()
+        self.read_with_polars.assert_called_once()
+        assert_frame_equal(result, expected)
+
+    def test_profiling_passes_use_polars(self):
+        Profiling().read_csv(self.csv_path)
+        self.read_with_polars.assert_not_called()
+        model = Profiling(use_polars=True).read_csv(self.csv_path)
+        self.read_with_polars.assert_called_once()
+        self.assertEqual(model.get_pandas_df["id"].tolist(), [1, 2, 3, 4])
+        Profiling().read_csv(self.csv_path, use_polars=True)
+        self.assertEqual(self.read_with_polars.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()